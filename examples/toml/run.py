@@ -3,9 +3,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from optionsconfig import init_options, ArgumentWriter, setup_logging
+from optionsconfig import init_options, ArgumentWriter, setup_logging, logger
 import argparse
-from optionsconfig import logger
 
 # Optionally setup logging first (will read log_file from pyproject.toml), to start logging as soon as possible, even before log_level option is set
 setup_logging(log_level="DEBUG")
@@ -22,8 +21,8 @@ args=arg_parser.parse_args()
 options = init_options(args=args, setup_logger=True)
 
 # Utilize options in your application
-logger.debug(f"Example Retrieval of enable_feature: {options.enable_feature}")
-logger.debug(f"Example Retrieval of feature_path: {options.feature_path}")
+logger.debug("Example Retrieval of enable_feature: {}", options.enable_feature)
+logger.debug("Example Retrieval of feature_path: {}", options.feature_path)
 
 # Test log level statements
 logger.debug("This is a DEBUG level message - detailed information for debugging")
@@ -2,21 +2,49 @@
 OptionsConfig - Schema-driven configuration management for Python applications
 """
 
-from .schema import get_schema
+import importlib
+import os
+
+from .schema import get_schema, clear_schema_cache, start_prewarm
 from .argument_writer import ArgumentWriter
 from .options import Options, init_options, setup_logging
-from .builders.env_builder import EnvBuilder
-from .builders.readme_builder import ReadmeBuilder
 from loguru import logger
 
+# Documentation builders are only needed when generating docs, so they are
+# imported on first access instead of on every `import optionsconfig`
+_LAZY = {
+    "EnvBuilder": ("optionsconfig.builders.env_builder", "EnvBuilder"),
+    "ReadmeBuilder": ("optionsconfig.builders.readme_builder", "ReadmeBuilder"),
+    "BuildAll": ("optionsconfig.builders.all_builder", "BuildAll"),
+}
+
+# Opt-in: load the schema from pyproject.toml in the background while the app starts up
+if os.environ.get("OPTIONSCONFIG_PREWARM") == "1":
+    start_prewarm()
+
 __version__ = "1.0.0"
 __all__ = [
     "get_schema",
+    "clear_schema_cache",
     "ArgumentWriter",
     "Options",
     "init_options",
     "setup_logging",
     "EnvBuilder",
     "ReadmeBuilder",
+    "BuildAll",
     "logger",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
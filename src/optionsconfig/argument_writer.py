@@ -2,20 +2,72 @@
 ArgumentWriter class for generating command line arguments from OPTIONS_SCHEMA
 """
 
-from argparse import ArgumentParser, ArgumentTypeError
-from typing import Literal, get_origin, get_args
+import sys
+from collections import deque
+from argparse import SUPPRESS, Action, ArgumentParser, ArgumentTypeError
 from pathlib import Path
+from typing import Literal, get_origin, get_args
 from loguru import logger
 
-from .schema import get_schema
+from .schema import get_schema, SchemaView
 
 class ArgumentWriter:
     """
     Helper class to write command line arguments based on OPTIONS_SCHEMA
     """
 
-    def __init__(self, schema: dict | None = None):
+    def __init__(self, schema: dict | None = None, minimal: bool = False):
+        """
+        Initialize ArgumentWriter.
+        
+        Args:
+            schema: The OPTIONS_SCHEMA dictionary. If None, loads from pyproject.toml configuration.
+            minimal: Only add arguments whose flag appears in sys.argv (all of them when
+                     -h/--help is given). For large schemas where few flags are passed;
+                     abbreviated flags are not recognized in this mode.
+        """
         self.schema = get_schema(schema=schema)
+        self.minimal = minimal
+        # Command line flag (e.g. --log-level) -> schema option name, built once
+        self._flag_to_key = {details["arg"]: option_name for option_name, details in self.schema.items()}
+        # Boolean option name -> its negated flag (e.g. --no-enable-feature)
+        self._negated_flags = {}
+        for option_name, details in self.schema.items():
+            negated_flag = "--no-" + details["arg"].removeprefix("--")
+            if details["type"] == bool and negated_flag not in self._flag_to_key:
+                self._negated_flags[option_name] = negated_flag
+        self._flag_to_key.update({flag: option_name for option_name, flag in self._negated_flags.items()})
+        # Option name -> (arg_name, add_argument kwargs) pairs, built once and reused for every parser
+        self._argument_table = {
+            option_name: self._build_argument_specs(option_name, details)
+            for option_name, details in self.schema.items()
+        }
+
+    @classmethod
+    def _get_converter(cls, arg_type):
+        """Get the callable argparse should use to convert a string to arg_type."""
+        if arg_type == bool:
+            return cls.str2bool
+        if arg_type == Path:
+            return cls.str2path
+        return arg_type
+
+    def get_option_name(self, arg: str) -> str | None:
+        """
+        Get the schema option name for a command line argument.
+        
+        Args:
+            arg: The argument as typed on the command line, e.g. "--log-level" or "--log-level=DEBUG"
+        
+        Returns:
+            The option name (e.g. "LOG_LEVEL") or None if the argument is not in the schema
+        """
+        return self._flag_to_key.get(arg.split("=", 1)[0])
+
+    @staticmethod
+    def str2path(v: str) -> Path | None:
+        """Convert string to Path for argparse; an empty string means no path, as it does for environment variables."""
+        return Path(v) if v else None
 
     @staticmethod
     def str2bool(v: str) -> bool:
@@ -29,26 +81,134 @@ class ArgumentWriter:
         else:
             raise ArgumentTypeError('Boolean value expected.')
 
-    def add_arguments(self, parser: ArgumentParser):
-        for option_name, details in self.schema.items():
-            arg_name = details["arg"]
-            arg_type = details["type"]
-            default = details["default"]
-            help_text = details.get("help", "") + f" (default: {default})"
-            
-            if arg_type == bool: # ensure Boolean Arguments section in SCHEMA.md is updated
-                parser.add_argument(arg_name, type=self.str2bool, nargs='?', const=True, default=None, help=help_text)
-                logger.debug(f"Added boolean argument {arg_name} with str2bool, const=True and default None")
-            elif get_origin(arg_type) is Literal:
-                # Handle Literal types by extracting the choices
-                choices = list(get_args(arg_type))
-                parser.add_argument(arg_name, choices=choices, default=None, help=help_text)
-                logger.debug(f"Added choice argument {arg_name} with choices {choices} and default None")
-            elif arg_type == Path:
-                # Handle Path types
-                parser.add_argument(arg_name, type=str, default=None, help=help_text)
-                logger.debug(f"Added path argument {arg_name} with default None")
-            else:
-                parser.add_argument(arg_name, type=arg_type, default=None, help=help_text)
-                logger.debug(f"Added argument {arg_name} with type {arg_type} and default None")
+    def build_parser(self, lazy: bool = False, fast_help: bool = False, **parser_kwargs) -> ArgumentParser:
+        """
+        Create an ArgumentParser with an argument for every option in the schema.
+        
+        Args:
+            lazy: Defer adding the arguments until the parser is first used (see add_arguments)
+            fast_help: Replace argparse's -h/--help with one that prints the options
+                       straight from the schema, grouped by section (argparse's own help
+                       is still used if other arguments are added to the parser)
+            **parser_kwargs: Passed through to ArgumentParser (e.g. description, prog)
+        
+        Returns:
+            The configured parser
+        """
+        if fast_help:
+            parser_kwargs["add_help"] = False
+        parser = ArgumentParser(**parser_kwargs)
+        if fast_help:
+            parser.add_argument("-h", "--help", action=_FastHelpAction, schema=self.schema, negated_flags=self._negated_flags)
+        self.add_arguments(parser, lazy=lazy)
+        return parser
+
+    def add_arguments(self, parser: ArgumentParser, lazy: bool = False):
+        """
+        Add an argument to the parser for every option in the schema.
+        
+        Args:
+            parser: The parser to add the arguments to
+            lazy: Defer the add_argument calls until the parser first parses
+                  arguments or formats its help/usage text
+        """
+        if lazy:
+            self._defer_arguments(parser, deque(self._argument_specs()))
+            logger.debug(f"Deferred {len(self.schema)} arguments until the parser is first used.")
+            return
+
+        for arg_name, kwargs in self._argument_specs():
+            parser.add_argument(arg_name, **kwargs)
         logger.debug(f"All arguments added to parser. Actual defaults will be set when the schema, args, and env are processed together.")
+
+    def _selected_options(self) -> list[str]:
+        """Get the names of the options to add arguments for."""
+        if not self.minimal:
+            return list(self.schema)
+        
+        argv = sys.argv[1:]
+        if "-h" in argv or "--help" in argv:
+            # Help output should stay complete
+            return list(self.schema)
+        
+        present = {self.get_option_name(token) for token in argv if token.startswith("--")}
+        return [option_name for option_name in self.schema if option_name in present]
+
+    def _argument_specs(self):
+        """Yield (arg_name, add_argument kwargs) for every selected option in the schema."""
+        for option_name in self._selected_options():
+            yield from self._argument_table[option_name]
+
+    def _build_argument_specs(self, option_name: str, details: dict) -> tuple[tuple[str, dict], ...]:
+        """Get the (arg_name, add_argument kwargs) pairs for one schema option."""
+        arg_name = details["arg"]
+        arg_type = details["type"]
+        default = details["default"]
+        help_text = details.get("help", "") + f" (default: {default})"
+        
+        if arg_type == bool: # ensure Boolean Arguments section in SCHEMA.md is updated
+            specs = [(arg_name, dict(type=self._get_converter(arg_type), nargs='?', const=True, default=None, help=help_text))]
+            if option_name in self._negated_flags:
+                # Same dest argparse derives from arg_name, so both flags set one value
+                dest = arg_name.removeprefix("--").replace("-", "_")
+                negated_flag = self._negated_flags[option_name]
+                specs.append((negated_flag, dict(dest=dest, action="store_const", const=False, default=None, help=f"Same as {arg_name} false")))
+            return tuple(specs)
+        elif get_origin(arg_type) is Literal:
+            # Handle Literal types by extracting the choices
+            return ((arg_name, dict(choices=list(get_args(arg_type)), default=None, help=help_text)),)
+        else:
+            # Path and other types convert with the type itself
+            return ((arg_name, dict(type=self._get_converter(arg_type), default=None, help=help_text)),)
+
+    @staticmethod
+    def _defer_arguments(parser: ArgumentParser, pending: deque[tuple[str, dict]]) -> None:
+        """Wrap the parser's entry points so the pending arguments are added on first use."""
+        def flush():
+            while pending:
+                arg_name, kwargs = pending.popleft()
+                parser.add_argument(arg_name, **kwargs)
+
+        # parse_args and error() route through these, so wrapping them covers every path
+        for method_name in ("parse_known_args", "format_help", "format_usage"):
+            original = getattr(parser, method_name)
+            def deferred(*args, _original=original, **kwargs):
+                flush()
+                return _original(*args, **kwargs)
+            setattr(parser, method_name, deferred)
+
+
+class _FastHelpAction(Action):
+    """
+    Help action that prints the schema's options by section without argparse's HelpFormatter.
+    
+    Falls back to argparse's own help when the parser has arguments that did not come from the schema.
+    """
+
+    def __init__(self, option_strings, schema: dict, negated_flags: dict, dest=SUPPRESS, default=SUPPRESS, help="show this help message and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+        self.schema = schema
+        self.negated_flags = negated_flags
+        self._schema_flags = {details["arg"] for details in schema.values()} | set(negated_flags.values())
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if any(action is not self and not self._schema_flags.issuperset(action.option_strings or [None]) for action in parser._actions):
+            # Caller-added arguments (or positionals/subcommands) need argparse's full help
+            parser.print_help()
+            parser.exit()
+        
+        lines = [f"usage: {parser.prog} [options]", ""]
+        if parser.description:
+            lines.extend([parser.description, ""])
+        lines.append(f"  {'-h, --help':30} {self.help}")
+        for section, option_names in SchemaView.from_schema(self.schema).by_section.items():
+            lines.extend(["", f"{section}:"])
+            for option_name in option_names:
+                details = self.schema[option_name]
+                lines.append(f"  {details['arg']:30} {details.get('help', '')} (default: {details['default']})")
+                if option_name in self.negated_flags:
+                    lines.append(f"  {self.negated_flags[option_name]:30} Same as {details['arg']} false")
+        if parser.epilog:
+            lines.extend(["", parser.epilog])
+        print("\n".join(lines))
+        parser.exit()
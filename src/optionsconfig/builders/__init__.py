@@ -7,8 +7,10 @@ formats from an OPTIONS_SCHEMA definition.
 
 from .env_builder import EnvBuilder
 from .readme_builder import ReadmeBuilder
+from .all_builder import BuildAll
 
 __all__ = [
     "EnvBuilder",
     "ReadmeBuilder",
+    "BuildAll",
 ]
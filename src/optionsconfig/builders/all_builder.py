@@ -0,0 +1,44 @@
+"""
+Build every generated documentation file from OPTIONS_SCHEMA in one go
+"""
+
+from pathlib import Path
+
+from optionsconfig.schema import get_schema
+from .env_builder import EnvBuilder
+from .readme_builder import ReadmeBuilder
+
+class BuildAll:
+    """Class to build .env.example and README option documentation from one schema load."""
+
+    def __init__(self, schema: dict | None = None, env_example_path: str | Path | None = None, readme_path: str | Path | None = None, project_root: str | Path | None = None):
+        """
+        Initialize BuildAll.
+
+        Args:
+            schema: The OPTIONS_SCHEMA dictionary. If None, loads from pyproject.toml configuration.
+            env_example_path: Optional path to .env.example file, see EnvBuilder.
+            readme_path: Optional path to README.md file, see ReadmeBuilder.
+            project_root: Directory containing pyproject.toml. If None, uses the current directory.
+        """
+        # Loaded and prepared once here, then shared by both builders as is
+        self.schema = get_schema(schema, project_root=project_root)
+        self.env_builder = EnvBuilder(schema=self.schema, env_example_path=env_example_path, project_root=project_root, _schema_prepared=True)
+        self.readme_builder = ReadmeBuilder(schema=self.schema, readme_path=readme_path, project_root=project_root, _schema_prepared=True)
+
+    def build(self) -> bool:
+        """Build .env.example, then README.md; stops at the first builder that fails."""
+
+        print("Building .env.example...")
+        if not self.env_builder.build():
+            print("ERROR: EnvBuilder failed")
+            return False
+        print()
+
+        print("Building README.md...")
+        if not self.readme_builder.build():
+            print("ERROR: ReadmeBuilder failed")
+            return False
+        print()
+
+        return True
@@ -9,6 +9,7 @@ For users of optionsconfig:
 - Copy this file to your project root or scripts directory
 - Ensure your OPTIONS_SCHEMA is configured in pyproject.toml
 - Run it to generate .env.example and update README.md
+- Pass --no-cache to force the schema to be reloaded from pyproject.toml
 
 This script:
 1. Generates .env.example from OPTIONS_SCHEMA
@@ -16,18 +17,24 @@ This script:
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add parent directories to path for imports
 repo_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(repo_root / "src"))
 
-from optionsconfig.schema import get_schema
-from optionsconfig.builders import EnvBuilder, ReadmeBuilder
+from optionsconfig.schema import clear_schema_cache, get_schema
+from optionsconfig.builders import BuildAll
 
 
-def main() -> bool:
-    """Run all documentation builders."""
+def main(no_cache: bool = False) -> bool:
+    """
+    Run all documentation builders.
+    
+    Args:
+        no_cache: Clear every cached schema before building so it is reloaded from pyproject.toml and the schema module
+    """
     
     print("Building all documentation from OPTIONS_SCHEMA...")
     print("=" * 60)
@@ -36,33 +43,22 @@ def main() -> bool:
         # Add repo root to path so src.options_schema can be imported
         sys.path.insert(0, str(repo_root))
         
-        # Get schema
+        # Get schema once and share it between the builders
+        if no_cache:
+            clear_schema_cache()
         schema = get_schema()
         print(f"Loaded schema with {len(schema)} options")
         print()
-        
-        # Build .env.example
-        print("Building .env.example...")
-        env_builder = EnvBuilder(schema=schema)
-        if not env_builder.build():
-            print("ERROR: EnvBuilder failed")
-            return False
-        print()
-        
-        # Build README.md
-        print("Building README.md...")
-        readme_builder = ReadmeBuilder(schema=schema)
-        if not readme_builder.build():
-            print("ERROR: ReadmeBuilder failed")
+        builders = BuildAll(schema=schema)
+        if not builders.build():
             return False
-        print()
         
         # Summary
         print("=" * 60)
         print("SUCCESS: All documentation built!")
         print("\nGenerated/Updated Files:")
-        print(f"   {env_builder.env_example_file} - Environment configuration template")
-        print(f"   {readme_builder.readme_file} - Updated with current option documentation")
+        print(f"   {builders.env_builder.env_example_file} - Environment configuration template")
+        print(f"   {builders.readme_builder.readme_file} - Updated with current option documentation")
         return True
         
     except Exception as e:
@@ -71,5 +67,8 @@ def main() -> bool:
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Build all documentation from OPTIONS_SCHEMA")
+    parser.add_argument("--no-cache", action="store_true", help="Reload the schema instead of using the cached one")
+    cli_args = parser.parse_args()
+    success = main(no_cache=cli_args.no_cache)
     sys.exit(0 if success else 1)
@@ -13,12 +13,12 @@ from typing import Dict, Any
 # Add parent directory to path to allow importing from src
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from optionsconfig.schema import get_schema
+from optionsconfig.schema import get_schema, load_pyproject_config, SchemaView
 
 class EnvBuilder:
     """Class to build .env.example from OPTIONS_SCHEMA."""
 
-    def __init__(self, schema: dict | None = None, env_example_path: str | Path | None = None):
+    def __init__(self, schema: dict | None = None, env_example_path: str | Path | None = None, project_root: str | Path | None = None, *, _schema_prepared: bool = False):
         """
         Initialize EnvBuilder.
         
@@ -26,9 +26,14 @@ class EnvBuilder:
             schema: The OPTIONS_SCHEMA dictionary. If None, loads from pyproject.toml configuration.
             env_example_path: Optional path to .env.example file.
                              If None, will check pyproject.toml or use default.
+            project_root: Directory containing pyproject.toml. If None, uses the current directory.
+                          Relative paths from the configuration are resolved against it.
+            _schema_prepared: schema was already returned by get_schema (used by BuildAll to skip preparing it again)
         """
+        self.project_root = Path(project_root) if project_root is not None else None
         self.env_example_file = self._get_env_example_path(env_example_path)
-        self.schema = get_schema(schema)
+        self.schema = schema if _schema_prepared else get_schema(schema, project_root=self.project_root)
+        self.schema_view = SchemaView.from_schema(self.schema)
 
     def build(self) -> bool:
         """Build the .env.example file."""
@@ -71,24 +76,10 @@ class EnvBuilder:
     def _load_path_from_config(self) -> Path | None:
         """Load env example file path from pyproject.toml."""
         try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                # Python < 3.11 and tomli not installed, skip this method
-                return None
-        
-        config_file = Path('pyproject.toml')
-        if not config_file.exists():
-            return None
-        
-        try:
-            with open(config_file, 'rb') as f:
-                config = tomllib.load(f)
-            
-            env_path = config.get('tool', {}).get('optionsconfig', {}).get('env_example_path')
+            env_path = load_pyproject_config(self.project_root).get('env_example_path')
             if env_path:
+                if self.project_root is not None:
+                    return self.project_root / env_path
                 return Path(env_path)
         except Exception:
             # If any error occurs reading config, return None
@@ -156,19 +147,8 @@ class EnvBuilder:
             lines.append(f'{env_var}="{default_str}"')
             lines.append("")  # Blank line after each option
         
-        # Group options by section while preserving order
-        sections_data = {}
-        section_order = []
-        
-        for option_name, details in self.schema.items():
-            section = details.get("section", "Other")
-            if section not in sections_data:
-                sections_data[section] = []
-                section_order.append(section)
-            sections_data[section].append((option_name, details))
-        
-        # Process options by section
-        for i, section in enumerate(section_order):
+        # Process options by section, preserving schema order
+        for i, (section, option_names) in enumerate(self.schema_view.by_section.items()):
             # Add extra blank line between sections (except before first section)
             if i > 0:
                 lines.append("")
@@ -176,8 +156,8 @@ class EnvBuilder:
             lines.append(f"# {section}")
             
             # Process all options in this section
-            for _, details in sections_data[section]:
-                process_option(details)
+            for option_name in option_names:
+                process_option(self.schema[option_name])
         
         return "\n".join(lines)
 
@@ -189,9 +169,17 @@ class EnvBuilder:
             # Generate new content
             new_content = self._generate_env_example()
             
+            # Leave the file untouched if it already has this content
+            try:
+                current_content = self.env_example_file.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                current_content = None
+            if current_content == new_content:
+                print(f"{self.env_example_file} is up to date (unchanged)")
+                return True
+            
             # Write to .env.example
-            with open(self.env_example_file, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            self.env_example_file.write_text(new_content, encoding="utf-8")
             
             print(f"Successfully updated {self.env_example_file}")
             print(f"Generated {len(new_content.splitlines())} lines")
@@ -199,11 +187,7 @@ class EnvBuilder:
             # Show summary of options
             option_count = len(self.schema)
             
-            # Count dependent options (options with depends_on field)
-            dependent_count = sum(
-                1 for details in self.schema.values()
-                if "depends_on" in details
-            )
+            dependent_count = len(self.schema_view.dependents)
             
             print(f"Processed {option_count} options ({option_count - dependent_count} root + {dependent_count} dependent)")
             
@@ -217,13 +201,8 @@ class EnvBuilder:
     def _validate_generated_file(self) -> bool:
         """Validate that the generated .env.example file is properly formatted."""
         
-        if not self.env_example_file.exists():
-            print(f"Generated file {self.env_example_file} does not exist")
-            return False
-        
         try:
-            with open(self.env_example_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = self.env_example_file.read_text(encoding="utf-8").splitlines()
             
             # Basic validation checks
             has_header = any("Use forward slashes" in line for line in lines[:5])
@@ -240,6 +219,9 @@ class EnvBuilder:
             print(f"Generated file validation passed ({len(lines)} lines)")
             return True
             
+        except FileNotFoundError:
+            print(f"Generated file {self.env_example_file} does not exist")
+            return False
         except Exception as e:
             print(f"Error validating generated file: {e}")
             return False
\ No newline at end of file
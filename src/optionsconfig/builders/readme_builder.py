@@ -15,12 +15,16 @@ from typing import Dict, Any
 # Add parent directory to path to allow importing from src
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from optionsconfig.schema import get_schema
+from optionsconfig.schema import get_schema, load_pyproject_config, SchemaView
+
+# The generated option docs replace everything between these markers in the README
+START_MARKER = "<!-- BEGIN_GENERATED_OPTIONS -->"
+END_MARKER = "<!-- END_GENERATED_OPTIONS -->"
 
 class ReadmeBuilder:
     """Class to build README option documentation from OPTIONS_SCHEMA."""
 
-    def __init__(self, schema: dict | None = None, readme_path: str | Path | None = None):
+    def __init__(self, schema: dict | None = None, readme_path: str | Path | None = None, project_root: str | Path | None = None, *, _schema_prepared: bool = False):
         """
         Initialize ReadmeBuilder.
         
@@ -28,9 +32,14 @@ class ReadmeBuilder:
             schema: The OPTIONS_SCHEMA dictionary. If None, loads from pyproject.toml configuration.
             readme_path: Optional path to README.md file.
                         If None, will check pyproject.toml or use default.
+            project_root: Directory containing pyproject.toml. If None, uses the current directory.
+                          Relative paths from the configuration are resolved against it.
+            _schema_prepared: schema was already returned by get_schema (used by BuildAll to skip preparing it again)
         """
+        self.project_root = Path(project_root) if project_root is not None else None
         self.readme_file = self._get_readme_path(readme_path)
-        self.schema = get_schema(schema)
+        self.schema = schema if _schema_prepared else get_schema(schema, project_root=self.project_root)
+        self.schema_view = SchemaView.from_schema(self.schema)
 
     def build(self) -> bool:
         """Build and update the README.md file with option documentation."""
@@ -75,24 +84,10 @@ class ReadmeBuilder:
     def _load_path_from_config(self) -> Path | None:
         """Load README path from pyproject.toml."""
         try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                # Python < 3.11 and tomli not installed, skip this method
-                return None
-        
-        config_file = Path('pyproject.toml')
-        if not config_file.exists():
-            return None
-        
-        try:
-            with open(config_file, 'rb') as f:
-                config = tomllib.load(f)
-            
-            readme_path = config.get('tool', {}).get('optionsconfig', {}).get('readme_path')
+            readme_path = load_pyproject_config(self.project_root).get('readme_path')
             if readme_path:
+                if self.project_root is not None:
+                    return self.project_root / readme_path
                 return Path(readme_path)
         except Exception:
             # If any error occurs reading config, return None
@@ -105,24 +100,16 @@ class ReadmeBuilder:
         
         lines = []
         
-        # Group options by section
-        sections_data = {}
-        for option_name, details in self.schema.items():
-            section = details.get("section", "Other")
-            if section not in sections_data:
-                sections_data[section] = []
-            
-            # Determine if this is a dependent option (has depends_on field)
-            is_dependent = "depends_on" in details
-            sections_data[section].append((option_name, details, is_dependent))
-        
         # Generate documentation for each section
-        for section, options in sections_data.items():
+        for section, option_names in self.schema_view.by_section.items():
             lines.extend([
                 f"#### {section}",
                 "",
             ])
-            for option_name, details, is_dependent in options:
+            for option_name in option_names:
+                details = self.schema[option_name]
+                # Determine if this is a dependent option (has depends_on field)
+                is_dependent = "depends_on" in details
                 self._add_option_doc_to_lines(lines, option_name, details, is_dependent)
             lines.append("")
         
@@ -195,64 +182,49 @@ class ReadmeBuilder:
     def _update_readme(self, options_content: str) -> bool:
         """Update README.md content between markers."""
         
-        if not self.readme_file.exists():
-            print(f"README.md not found at {self.readme_file}")
-            return False
-        
         try:
             # Read README
-            with open(self.readme_file, "r", encoding="utf-8") as f:
-                readme_content = f.read()
+            readme_content = self.readme_file.read_text(encoding="utf-8")
             
-            # Define markers
-            start_marker = "<!-- BEGIN_GENERATED_OPTIONS -->"
-            end_marker = "<!-- END_GENERATED_OPTIONS -->"
-            
-            # Check if markers exist
-            if start_marker not in readme_content or end_marker not in readme_content:
-                raise ValueError(
-                    f"Markers not found in {self.readme_file}\n"
-                    f"Add these markers where you want the option docs:\n"
-                    f"    {start_marker}\n"
-                    f"    {end_marker}"
-                )
-            
-            # Replace content between markers
-            start_pos = readme_content.find(start_marker)
-            end_pos = readme_content.find(end_marker)
+            # Find the markers; the end marker is searched for after the start marker only
+            start_pos = readme_content.find(START_MARKER)
+            end_pos = readme_content.find(END_MARKER, start_pos + len(START_MARKER)) if start_pos != -1 else -1
             
             if start_pos == -1 or end_pos == -1:
                 raise ValueError(
                     f"Markers not found in {self.readme_file}\n"
                     f"Add these markers where you want the option docs:\n"
-                    f"    {start_marker}\n"
-                    f"    {end_marker}"
+                    f"    {START_MARKER}\n"
+                    f"    {END_MARKER}"
                 )
             
             # Get content before start marker and after end marker
             before_content = readme_content[:start_pos]
-            after_content = readme_content[end_pos + len(end_marker):]
+            after_content = readme_content[end_pos + len(END_MARKER):]
             
             # Combine with new content
-            new_readme_content = f"{before_content}{start_marker}\n{options_content}\n{end_marker}{after_content}"
+            new_readme_content = f"{before_content}{START_MARKER}\n{options_content}\n{END_MARKER}{after_content}"
+            
+            # Leave the file untouched if the generated section has not changed
+            if new_readme_content == readme_content:
+                print(f"{self.readme_file} is up to date (unchanged)")
+                return True
             
             # Write updated README
-            with open(self.readme_file, "w", encoding="utf-8") as f:
-                f.write(new_readme_content)
+            self.readme_file.write_text(new_readme_content, encoding="utf-8")
             
             print(f"Successfully updated {self.readme_file}")
             
             # Show summary of options
             option_count = len(self.schema)
             
-            # Count dependent options (options with depends_on field)
-            dependent_count = sum(
-                1 for details in self.schema.values()
-                if "depends_on" in details
-            )
+            dependent_count = len(self.schema_view.dependents)
             
             print(f"Processed {option_count} options ({option_count - dependent_count} root + {dependent_count} dependent)")
             
+        except FileNotFoundError:
+            print(f"README.md not found at {self.readme_file}")
+            return False
         except ValueError:
             # Re-raise ValueError (e.g., markers not found)
             raise
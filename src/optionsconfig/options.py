@@ -3,22 +3,36 @@ Options class for managing application configuration
 """
 
 from dotenv import load_dotenv
+import functools
 import os
 import sys
 from argparse import Namespace
-from typing import Literal, get_origin, get_args
+from typing import Any, Callable, Literal, NamedTuple, get_origin, get_args
 from pathlib import Path
 from loguru import logger
 
-from .schema import get_schema
+from .schema import get_schema, load_pyproject_config
 
-def setup_logging(log_file: str | Path | None = None, log_level: str = "DEBUG", delete_existing: bool = False) -> Path:
+# Handlers added by setup_logging, and the file and level they were added with
+_log_state = {"log_path": None, "level_no": None, "handler_ids": []}
+
+
+def _debug_enabled() -> bool:
+    """Whether any logging handler currently lets DEBUG records through."""
+    # loguru tracks the lowest level of all its handlers
+    return logger._core.min_level <= logger.level("DEBUG").no
+
+
+def setup_logging(log_file: str | Path | None = None, log_level: str | int = "DEBUG", delete_existing: bool = False) -> Path:
     """
     Setup loguru logging to the specified log file.
     
+    Calling this again with the same log file and level keeps the handlers
+    added previously, as long as they have not been removed in the meantime.
+    
     Args:
         log_file: Path to log file. If None, uses default location.
-        log_level: Logging level (default: DEBUG)
+        log_level: Logging level name or number (default: DEBUG)
         delete_existing: Whether to delete existing loggers (default: False)
         
     Returns:
@@ -40,42 +54,42 @@ def setup_logging(log_file: str | Path | None = None, log_level: str = "DEBUG",
     # Ensure parent directory exists
     os.makedirs(log_path.parent, exist_ok=True)
     
+    # Resolve the level up front so an invalid name fails before any handler changes
+    level_no = log_level if isinstance(log_level, int) else logger.level(log_level).no
+    
     # Delete existing loggers if requested
     if delete_existing:
         logger.remove()
+        _log_state["handler_ids"] = []
         # Clear the log file when deleting existing loggers
-        with open(log_path, 'w') as f:
-            pass
+        open(log_path, 'wb').close()
     
-    # Check existing handlers and merge instead of replace
     existing_handlers = logger._core.handlers
-    file_handler_exists = any(str(log_path) in str(handler) for handler in existing_handlers.values())
-    stdout_handler_exists = any("stdout" in str(handler) or "sys.stdout" in str(handler) for handler in existing_handlers.values())
     
-    # Add or update handlers
-    format_with_color = "<level>{level}</level> | <cyan>{module}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    # Nothing to do if the handlers from the previous call are still there with the same file and level
+    if (_log_state["handler_ids"]
+            and _log_state["log_path"] == log_path
+            and _log_state["level_no"] == level_no
+            and all(handler_id in existing_handlers for handler_id in _log_state["handler_ids"])):
+        return log_path
     
-    if not file_handler_exists:
-        # Add new file handler with append mode (don't clear file)
-        logger.add(str(log_path), level=log_level, rotation="30 MB", retention="10 days", enqueue=True, format=format_with_color, mode="a")
-    else:
-        # Remove existing file handler and add new one with updated level
-        for handler_id, handler in existing_handlers.items():
-            if str(log_path) in str(handler):
-                logger.remove(handler_id)
-                break
-        logger.add(str(log_path), level=log_level, rotation="30 MB", retention="10 days", enqueue=True, format=format_with_color, mode="a")
+    # Check existing handlers and replace them instead of adding duplicates
+    stale_ids = set(_log_state["handler_ids"]) & existing_handlers.keys()
+    stale_ids.update(
+        handler_id for handler_id, handler in existing_handlers.items()
+        if str(log_path) in str(handler) or "stdout" in str(handler)
+    )
+    for handler_id in stale_ids:
+        logger.remove(handler_id)
     
-    if not stdout_handler_exists:
-        # Add new stdout handler
-        logger.add(sys.stdout, level=log_level, format=format_with_color)
-    else:
-        # Remove existing stdout handler and add new one with updated level
-        for handler_id, handler in existing_handlers.items():
-            if "stdout" in str(handler) or "sys.stdout" in str(handler):
-                logger.remove(handler_id)
-                break
-        logger.add(sys.stdout, level=log_level, format=format_with_color)
+    format_with_color = "<level>{level}</level> | <cyan>{module}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    _log_state["level_no"] = level_no
+    _log_state["log_path"] = log_path
+    _log_state["handler_ids"] = [
+        # File handler in append mode (don't clear file)
+        logger.add(str(log_path), level=level_no, rotation="30 MB", retention="10 days", enqueue=True, format=format_with_color, mode="a"),
+        logger.add(sys.stdout, level=level_no, format=format_with_color),
+    ]
     
     logger.debug(f"Logging initialized to: {log_path} and stdout")
     
@@ -85,23 +99,7 @@ def setup_logging(log_file: str | Path | None = None, log_level: str = "DEBUG",
 def _load_log_file_from_config() -> Path | None:
     """Load log file path from pyproject.toml."""
     try:
-        import tomllib
-    except ImportError:
-        try:
-            import tomli as tomllib
-        except ImportError:
-            # Python < 3.11 and tomli not installed, skip this method
-            return None
-    
-    config_file = Path('pyproject.toml')
-    if not config_file.exists():
-        return None
-    
-    try:
-        with open(config_file, 'rb') as f:
-            config = tomllib.load(f)
-        
-        log_file_path = config.get('tool', {}).get('optionsconfig', {}).get('log_file')
+        log_file_path = load_pyproject_config().get('log_file')
         if log_file_path:
             return Path(log_file_path)
     except Exception:
@@ -130,6 +128,8 @@ class Options:
             logger.debug(f".env not found at: {env_file}")
         
         self.schema = get_schema(schema=schema)
+        self._compiled = _compile_schema(self.schema)
+        self._options_with_deps = tuple(option for option in self._compiled if option.depends_on)
         
         # Setup logging if requested
         if setup_logger:
@@ -148,27 +148,20 @@ class Options:
         else:
             args_dict = {}
 
-        # Identify root options (options that other options depend on)
-        self.root_options = []
-        for option_name, details in self.schema.items():
-            # An option is a root option if other options depend on it
-            is_root = any(
-                option_name in self.schema[other_option]["depends_on"]
-                for other_option in self.schema
-            )
-            if is_root:
-                self.root_options.append(option_name)
+        # Identify root options (options that other options depend on), in schema order
+        depended_on = {dep for option in self._compiled for dep in option.depends_on}
+        self.root_options = [option.name for option in self._compiled if option.name in depended_on]
 
         # Process the schema to set all attributes
-        options = self._process_schema(self.schema, args_dict)
+        options = self._process_schema(args_dict)
 
-        # Set attributes dynamically using lowercase underscore format
-        for key, value in options.items():
-            # Convert schema key (UPPER_CASE) to attribute name (lower_case)
-            details = self.schema[key]
-            var_name = details["var"]
-            setattr(self, var_name, value)
-            logger.debug(f"Set option {var_name} to value: {value if not details['sensitive'] else '***HIDDEN***'}")
+        # Set attributes dynamically using each option's var name
+        debug = _debug_enabled()
+        for option in self._compiled:
+            value = options[option.name]
+            setattr(self, option.var, value)
+            if debug:
+                logger.debug(f"Set option {option.var} to value: {value if not option.sensitive else '***HIDDEN***'}")
 
         # Set log level
         if setup_logger and getattr(self, 'log_file', None) is not None:
@@ -178,94 +171,84 @@ class Options:
         
         self.log()
 
-    def _process_schema(self, schema: dict, args_dict: dict) -> dict:
+    def _process_schema(self, args_dict: dict) -> dict:
         """Process the option schema, env options, and args to get the combined options."""
 
         options = {}
+        # Debug messages are only built when DEBUG is enabled
+        debug = _debug_enabled()
+        # Names of options whose value came from args or env rather than the default
+        explicitly_set = set()
+        # Bound once, these are called for every option
+        args_get = args_dict.get
+        env_get = os.environ.get
+        mark_explicit = explicitly_set.add
 
         # Process all options in the schema
-        for option_name, details in schema.items():
-            # Convert arg name to attribute name (remove -- and convert - to _)
-            var_name = details["var"]
-            
-            # Get value in order of priority: args -> env -> default
-            value = None
+        for option in self._compiled:
+            name = option.name
+            var_name = option.var
 
-            logger.debug(f"Processing option: {option_name} (var: {var_name})")
+            if debug:
+                logger.debug(f"Processing option: {name} (var: {var_name})")
 
+            # Get value in order of priority: args -> env -> default
             # 1. Check args first
-            if var_name in args_dict and args_dict[var_name] is not None:
-                value = args_dict[var_name]
-                logger.debug(f"Argument {var_name} found in args with value: {value if not details['sensitive'] else '***HIDDEN***'}")
+            if (value := args_get(var_name)) is not None:
+                mark_explicit(name)
+                if debug:
+                    logger.debug(f"Argument {var_name} found in args with value: {value if not option.sensitive else '***HIDDEN***'}")
             # 2. Check environment variable
-            elif details["env"] in os.environ:
-                env_value = os.environ[details["env"]]
-                logger.debug(f"Environment variable {details['env']} found with value: {env_value if not details['sensitive'] else '***HIDDEN***'}")
+            elif (env_value := env_get(option.env)) is not None:
+                if debug:
+                    logger.debug(f"Environment variable {option.env} found with value: {env_value if not option.sensitive else '***HIDDEN***'}")
                 # Convert environment string to proper type
-                if details["type"] == bool:
-                    value = is_truthy(env_value)
-                elif details["type"] == Path:
-                    value = Path(env_value) if env_value else None
-                elif get_origin(details["type"]) is Literal:
-                    # For Literal types, use the string value directly if it's valid
-                    valid_choices = get_args(details["type"])
-                    value = env_value if env_value in valid_choices else details["default"]
-                else:
-                    value = details["type"](env_value) if env_value else details["default"]
+                value = option.convert(env_value)
+                mark_explicit(name)
             # 3. Use default
             else:
-                value = details["default"]
+                value = option.default
             
             # Store
-            options[option_name] = value
+            options[name] = value
 
         # If none of the root options have been explicitly set (from args or env), default all to true for ease of use
         # Check if any root option was explicitly provided (not just defaulted from schema)
-        explicitly_set_root_options = []
-        for root_option in self.root_options:
-            var_name = self.schema[root_option]["var"]
-            # Check if it was in args or environment
-            if (var_name in args_dict and args_dict[var_name] is not None) or \
-               self.schema[root_option]["env"] in os.environ:
-                explicitly_set_root_options.append(root_option)
-        
-        if not explicitly_set_root_options:
+        if explicitly_set.isdisjoint(self.root_options):
             # No root options were explicitly set, default all to True
             for root_option in self.root_options:
                 options[root_option] = True
-            logger.debug("No root options explicitly set, defaulting all to True")
+            if debug:
+                logger.debug("No root options explicitly set, defaulting all to True")
 
         return options
     
     def validate(self) -> None:
         # Validate that options with dependencies have their requirements met
-        options_as_dict = {k.upper(): v for k, v in self.__dict__.items() if k != 'root_options'}
+        if not self._options_with_deps:
+            return
+        debug = _debug_enabled()
         
         # Check each option that has dependencies
-        for option_name, details in self.schema.items():
-            depends_on_list = details["depends_on"]
-            if not depends_on_list:
+        for option in self._options_with_deps:
+            value = getattr(self, option.var)
+            if value is not None and not debug:
+                # Set options pass whatever their dependencies are
                 continue
             
-            # Check if ANY of the dependencies are True
-            any_dependency_true = any(
-                options_as_dict[dep_option] is True
-                for dep_option in depends_on_list
-            )
+            # Collect the dependencies that are True in one pass
+            active_dependencies = [
+                dep for dep, dep_var in zip(option.depends_on, option.depends_on_vars)
+                if getattr(self, dep_var) is True
+            ]
             
-            if any_dependency_true:
-                value = options_as_dict.get(option_name)
+            if active_dependencies:
                 if value is None:
-                    # Build a helpful error message
-                    active_dependencies = [
-                        dep for dep in depends_on_list
-                        if options_as_dict[dep] is True
-                    ]
                     raise ValueError(
-                        f"{option_name} is required when any of the following are true: "
-                        f"{', '.join(depends_on_list)}. Currently active: {', '.join(active_dependencies)}"
+                        f"{option.name} is required when any of the following are true: "
+                        f"{', '.join(option.depends_on)}. Currently active: {', '.join(active_dependencies)}"
                     )
-                logger.debug(f"Dependent option {option_name} is set to {value if not details['sensitive'] else '***HIDDEN***'}")
+                logger.debug(f"Dependent option {option.name} is set to {value if not option.sensitive else '***HIDDEN***'}")
         
     def log(self):
         """
@@ -274,18 +257,71 @@ class Options:
         # Dynamically log all attributes that were set from the schema
         log_lines = ["Options initialized with:"]
         
-        for option_name, details in self.schema.items():
-            var_name = details["var"]
-            if hasattr(self, var_name):
-                value = getattr(self, var_name)
-                # Don't log sensitive information
-                if details["sensitive"]:
-                    value = "***HIDDEN***"
-                log_lines.append(f"{option_name}: {value}")
+        # Every option attribute is set in __init__, so no hasattr check is needed
+        for option in self._compiled:
+            # Don't log sensitive information
+            value = "***HIDDEN***" if option.sensitive else getattr(self, option.var)
+            log_lines.append(f"{option.name}: {value}")
         
         logger.info("\n".join(log_lines))
 
 
+class _CompiledOption(NamedTuple):
+    """The parts of an option definition Options reads, extracted once per schema."""
+    name: str
+    var: str
+    env: str
+    type: Any
+    default: Any
+    sensitive: bool
+    depends_on: tuple[str, ...]
+    depends_on_vars: tuple[str, ...]  # Attribute names of the depends_on options
+    convert: Callable[[str], Any]  # Converts an environment variable string to the option's type
+
+
+def _compile_schema(schema: dict) -> tuple[_CompiledOption, ...]:
+    """Extract the per-option values used while processing options from a loaded schema."""
+    return tuple(
+        _CompiledOption(
+            name=option_name,
+            var=details["var"],
+            env=details["env"],
+            type=details["type"],
+            default=details["default"],
+            sensitive=details["sensitive"],
+            depends_on=tuple(details["depends_on"]),
+            depends_on_vars=tuple(schema[dep]["var"] for dep in details["depends_on"]),
+            convert=_make_converter(details["type"], details["default"]),
+        )
+        for option_name, details in schema.items()
+    )
+
+
+def _make_converter(option_type: Any, default: Any) -> Callable[[str], Any]:
+    """Get the function that converts an environment variable string to option_type."""
+    if option_type == bool:
+        return is_truthy
+    if option_type == Path:
+        return _convert_path
+    if get_origin(option_type) is Literal:
+        # For Literal types, use the string value directly if it's valid
+        return functools.partial(_convert_choice, frozenset(get_args(option_type)), default)
+    return functools.partial(_convert_type, option_type, default)
+
+
+# Module-level converters (not lambdas) so Options instances can be copied and pickled
+def _convert_path(value: str) -> Path | None:
+    return Path(value) if value else None
+
+
+def _convert_choice(choices: frozenset, default: Any, value: str) -> Any:
+    return value if value in choices else default
+
+
+def _convert_type(option_type: type, default: Any, value: str) -> Any:
+    return option_type(value) if value else default
+
+
 # Helper to initialize OPTIONS with direct args if available
 def init_options(args: Namespace | None = None, schema: dict | None = None, log_file: str | Path | None = None, setup_logger: bool = True) -> Options:
     global OPTIONS
@@ -293,14 +329,9 @@ def init_options(args: Namespace | None = None, schema: dict | None = None, log_
     return OPTIONS
 
 
+# Lowercase strings accepted as True, matching ArgumentWriter.str2bool
+_TRUTHY = frozenset({'true', 't', 'yes', 'y', '1'})
+
+
 def is_truthy(string):
-    TRUE_THO = [
-        True,
-        'true',
-        'True',
-        'TRUE',
-        't',
-        'T',
-        1,
-    ]
-    return string in TRUE_THO
+    return string is True or string == 1 or (isinstance(string, str) and string.lower() in _TRUTHY)
@@ -1,4 +1,11 @@
-from typing import TypedDict, List, Optional, Any
+import functools
+import importlib
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TypedDict, List, Optional, Any, Callable, Iterator, Mapping
 from pathlib import Path
 
 
@@ -17,7 +24,41 @@ class OptionDefinition(TypedDict, total=False):
     sensitive: Optional[bool]
 
 
-def get_schema(schema: dict | None = None) -> dict:
+@dataclass(frozen=True, slots=True)
+class SchemaView:
+    """
+    Read-only view of a loaded schema with commonly used groupings precomputed.
+    
+    Attributes:
+        by_section: Section name -> option names in that section, in schema order
+        dependents: Option names that depend on at least one other option
+    """
+    by_section: Mapping[str, tuple[str, ...]]
+    dependents: tuple[str, ...]
+
+    @classmethod
+    def from_schema(cls, schema: dict) -> "SchemaView":
+        """Build a view from a schema that has already been through get_schema."""
+        by_section = {}
+        dependents = []
+        for option_name, details in schema.items():
+            by_section.setdefault(details.get("section", "Other"), []).append(option_name)
+            if details.get("depends_on"):
+                dependents.append(option_name)
+        return cls(
+            by_section=MappingProxyType({section: tuple(names) for section, names in by_section.items()}),
+            dependents=tuple(dependents),
+        )
+
+
+# (pyproject.toml key, schema) from the last successful config load, see _config_file_key
+_config_schema: tuple[tuple[str, int] | None, dict] | None = None
+
+# Set by clear_schema_cache so the next config load re-executes an already imported schema module
+_reload_schema_module = False
+
+
+def get_schema(schema: dict | None = None, project_root: str | Path | None = None) -> dict:
     """
     Load OPTIONS_SCHEMA from available sources.
     
@@ -25,8 +66,14 @@ def get_schema(schema: dict | None = None) -> dict:
     1. Direct schema dict passed as argument
     2. Configuration file (pyproject.toml)
     
+    The schema loaded from the configuration file is reused until
+    pyproject.toml is modified or the working directory changes; each
+    call gets its own copy, so changes to it are not seen by other callers.
+    
     Args:
         schema: Direct schema dict to use
+        project_root: Directory containing pyproject.toml. If None, uses the current directory.
+                      The configured schema_module must still be importable.
     
     Returns:
         The OPTIONS_SCHEMA dictionary
@@ -36,20 +83,25 @@ def get_schema(schema: dict | None = None) -> dict:
     """
     # 1. Direct schema dict
     if schema is not None:
-        schema = default_schema_details(schema)
-        errors = validate_schema(schema)
+        prepared, errors = _prepare(schema)
         if errors:
             raise ValueError("Invalid schema: " + "\n".join(errors))
-        return schema
+        return prepared
     
     # 2. Configuration file (pyproject.toml)
-    config_schema = _load_schema_from_config()
+    global _config_schema
+    _wait_for_prewarm()
+    config_key = _config_file_key(project_root)
+    if _config_schema is not None and _config_schema[0] == config_key:
+        return _copy_schema(_config_schema[1])
+    
+    config_schema = _load_schema_from_config(project_root)
     if config_schema:
-        config_schema = default_schema_details(config_schema)
-        errors = validate_schema(config_schema)
+        config_schema, errors = _prepare(config_schema)
         if errors:
             raise ValueError("Invalid schema: " + "\n".join(errors))
-        return config_schema
+        _config_schema = (config_key, config_schema)
+        return _copy_schema(config_schema)
     
     raise ImportError(
         "No OPTIONS_SCHEMA found.\n"
@@ -59,39 +111,153 @@ def get_schema(schema: dict | None = None) -> dict:
     )
 
 
-def _load_schema_from_config() -> dict | None:
-    """Load schema module path from pyproject.toml."""
+def _copy_schema(schema: dict) -> dict:
+    """Copy a prepared schema and each option definition in it, so the cached original can't be modified through the result."""
+    return {option_name: dict(details) for option_name, details in schema.items()}
+
+
+def load_pyproject_config(project_root: str | Path | None = None) -> dict:
+    """
+    Load the [tool.optionsconfig] table from pyproject.toml.
+    
+    The table is cached on the file's path and modification time, so repeated
+    callers share one read and edits to the file are still picked up.
+    
+    Args:
+        project_root: Directory containing pyproject.toml. If None, uses the current directory.
+    
+    Returns:
+        The table, or an empty dict if there is no pyproject.toml or no TOML parser
+    """
+    config_key = _config_file_key(project_root)
+    if config_key is None:
+        return {}
+    return _load_config_table_cached(*config_key)
+
+
+def _config_file_key(project_root: str | Path | None = None) -> tuple[str, int] | None:
+    """Get (absolute path, mtime_ns) of pyproject.toml in project_root (default: current directory), or None if it doesn't exist."""
+    # One stat() call both checks existence and gets the modification time
+    config_path = os.path.abspath(os.path.join(project_root or '', 'pyproject.toml'))
     try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return config_path, mtime_ns
+
+
+@functools.lru_cache(maxsize=1)
+def _get_toml():
+    """Import the TOML parser on first use; returns None if neither tomllib nor tomli is available."""
+    if sys.version_info >= (3, 11):
         import tomllib
+        return tomllib
+    try:
+        import tomli
     except ImportError:
-        try:
-            import tomli as tomllib
-        except ImportError:
-            # Python < 3.11 and tomli not installed, skip this method
+        # Python < 3.11 and tomli not installed, pyproject.toml configuration is unavailable
+        return None
+    return tomli
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_table_cached(path_str: str, mtime_ns: int) -> dict:
+    """Read the [tool.optionsconfig] table from a pyproject.toml file. mtime_ns is only part of the cache key."""
+    # One read of the whole file, then parse from memory
+    text = Path(path_str).read_bytes().decode('utf-8')
+    
+    table = _scan_config_table(text)
+    if table is not None:
+        return table
+    
+    # Only import a TOML parser when the simple scan can't read the file
+    toml = _get_toml()
+    if toml is None:
+        return {}
+    try:
+        return toml.loads(text)['tool']['optionsconfig']
+    except (KeyError, TypeError):
+        return {}
+
+
+_CONFIG_TABLE_HEADER = "[tool.optionsconfig]"
+
+
+def _scan_config_table(text: str) -> dict | None:
+    """
+    Read the [tool.optionsconfig] table without a TOML parser.
+    
+    Only handles the common layout: a single [tool.optionsconfig] header followed
+    by `key = "string"` lines. Returns None for anything else (other value types,
+    escapes, multi-line strings, dotted keys or inline tables mentioning
+    optionsconfig) so the caller falls back to a full TOML parse.
+    """
+    if '"""' in text or "'''" in text:
+        return None
+    
+    table = None
+    in_table = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("["):
+            if line == _CONFIG_TABLE_HEADER and table is None:
+                table = {}
+                in_table = True
+                continue
+            if "optionsconfig" in line:
+                # Duplicate header, sub-table or a header with a trailing comment
+                return None
+            in_table = False
+            continue
+        if not in_table:
+            if "optionsconfig" in line:
+                # e.g. `optionsconfig = {...}` under [tool]
+                return None
+            continue
+        
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key.isascii() or not key.replace("_", "").replace("-", "").isalnum() or key in table:
+            return None
+        if len(value) < 2 or value[0] not in "\"'" or value[-1] != value[0]:
             return None
+        inner = value[1:-1]
+        if '"' in inner or "'" in inner or "\\" in inner:
+            return None
+        table[key] = inner
     
-    config_file = Path('pyproject.toml')
-    if not config_file.exists():
+    return table if table is not None else {}
+
+
+def _load_schema_from_config(project_root: str | Path | None = None) -> dict | None:
+    """Load schema module path from pyproject.toml."""
+    schema_module = load_pyproject_config(project_root).get('schema_module')
+    if not schema_module:
         return None
     
+    global _reload_schema_module
     try:
-        with open(config_file, 'rb') as f:
-            config = tomllib.load(f)
-        
-        schema_module = config.get('tool', {}).get('optionsconfig', {}).get('schema_module')
-        if schema_module:
-            module = __import__(schema_module, fromlist=['OPTIONS_SCHEMA'])
-            return module.OPTIONS_SCHEMA
+        if _reload_schema_module and schema_module in sys.modules:
+            module = importlib.reload(sys.modules[schema_module])
+        else:
+            module = importlib.import_module(schema_module)
     except ImportError as e:
         raise ImportError(f"Could not import schema module '{schema_module}': {e}")
-    
-    return None
+    _reload_schema_module = False
+    return getattr(module, 'OPTIONS_SCHEMA')
 
 
 def load_schema() -> dict | None:
     """
     Load OPTIONS_SCHEMA from available sources without raising exceptions.
     
+    Uses get_schema's cache, so repeated callers only parse pyproject.toml once
+    per version of the file. Call `clear_schema_cache()` to force a reload
+    after editing the schema module.
+    
     Returns:
         The OPTIONS_SCHEMA dictionary or None if not found
     """
@@ -99,18 +265,81 @@ def load_schema() -> dict | None:
         return get_schema()
     except ImportError:
         return None
+
+
+_prewarm_thread: threading.Thread | None = None
+# Exception raised by the prewarm thread, re-raised once by the next _wait_for_prewarm()
+_prewarm_error: BaseException | None = None
+
+
+def start_prewarm() -> None:
+    """
+    Start loading the configured schema in a background daemon thread.
     
+    This parses pyproject.toml and imports the schema module while the
+    application does other startup work (e.g. building its argument parser).
+    The next get_schema() call without a schema waits for it to finish and
+    raises any error the background load hit.
+    """
+    global _prewarm_thread
+    if _prewarm_thread is None:
+        _prewarm_thread = threading.Thread(target=_prewarm, name="optionsconfig-prewarm", daemon=True)
+        _prewarm_thread.start()
+
+
+def _prewarm() -> None:
+    """Thread target for start_prewarm; stores the error instead of letting the thread print it."""
+    global _prewarm_error
+    try:
+        load_schema()
+    except BaseException as e:
+        _prewarm_error = e
+
+
+def _wait_for_prewarm() -> None:
+    """Block until a prewarm started by start_prewarm() has finished, then raise its error if it had one."""
+    global _prewarm_error
+    if _prewarm_thread is not None and _prewarm_thread is not threading.current_thread():
+        _prewarm_thread.join()
+        error, _prewarm_error = _prewarm_error, None
+        if error is not None:
+            raise error
+
+
+def clear_schema_cache() -> None:
+    """
+    Forget every cached schema so the next load reads pyproject.toml and the schema module again.
+    
+    Clears the get_schema config memo and the pyproject.toml table cache, and
+    re-executes the schema module on the next load so edits to it are picked up.
+    """
+    global _config_schema, _reload_schema_module
+    # A running prewarm would otherwise repopulate the caches after they are cleared
+    _wait_for_prewarm()
+    _config_schema = None
+    _reload_schema_module = True
+    _load_config_table_cached.cache_clear()
+
+
+# Values for optional fields missing from an option definition ("var" defaults to the lowercased option name).
+# The empty tuple is shared by every option without dependencies.
+DEFAULTS = MappingProxyType({"sensitive": False, "depends_on": ()})
+
+# Fields every option must have once DEFAULTS are applied
+REQUIRED_FIELDS = frozenset({"env", "arg", "var", "type", "default", "section", "help", "sensitive", "depends_on"})
+
 
 def default_schema_details(schema: dict) -> dict:
-    defaulted_schema = schema.copy()
-    for option_name, details in schema.items():
-        if "sensitive" not in details:
-            defaulted_schema[option_name]["sensitive"] = False
-        if "depends_on" not in details:
-            defaulted_schema[option_name]["depends_on"] = []
-        if "var" not in details:
-            defaulted_schema[option_name]["var"] = option_name.lower()
-    return defaulted_schema
+    """Get a copy of schema with DEFAULTS filled in for each option; the passed schema is not modified."""
+    return {
+        option_name: _apply_defaults(option_name, details) if isinstance(details, dict) else details
+        for option_name, details in schema.items()
+    }
+
+
+def _apply_defaults(option_name: str, details: dict) -> dict:
+    """Get a copy of one option definition with DEFAULTS and the default "var" filled in."""
+    return {**DEFAULTS, "var": option_name.lower(), **details}
 
 
 def validate_schema(schema: dict) -> list[str]:
@@ -123,67 +352,121 @@ def validate_schema(schema: dict) -> list[str]:
     Returns:
         List of error messages (empty list if valid)
     """
-    errors = []
+    return list(iter_validation_errors(schema))
+
+
+def iter_validation_errors(schema: dict) -> Iterator[str]:
+    """
+    Yield the error messages for user's OPTIONS_SCHEMA one at a time.
+    
+    Use `next(iter_validation_errors(schema), None)` to stop at the first error.
     
+    Args:
+        schema: The OPTIONS_SCHEMA dictionary to validate
+    
+    Yields:
+        Error messages, in the same order validate_schema returns them
+    """
     if not isinstance(schema, dict):
-        errors.append("Schema must be a dictionary")
-        return errors
+        yield "Schema must be a dictionary"
+        return
     
     if not schema:
-        errors.append("Schema is empty")
-        return errors
+        yield "Schema is empty"
+        return
     
-    required_fields = ["env", "arg", "var", "type", "default", "section", "help", "sensitive", "depends_on"] # some are defaulted beforehand
+    for option_name, details in schema.items():
+        if not isinstance(details, dict):
+            yield f"{option_name}: Option definition must be a dictionary"
+            continue
+        yield from _iter_option_errors(option_name, details, schema)
+
+
+def _prepare(schema: dict) -> tuple[dict, list[str]]:
+    """
+    Apply DEFAULTS to and validate every option in one pass over the schema.
+    
+    Equivalent to validate_schema(default_schema_details(schema)).
     
+    Args:
+        schema: The OPTIONS_SCHEMA dictionary
+    
+    Returns:
+        (defaulted schema, list of error messages)
+    """
+    if not isinstance(schema, dict):
+        return schema, ["Schema must be a dictionary"]
+    if not schema:
+        return schema, ["Schema is empty"]
+    
+    prepared = {}
+    errors = []
     for option_name, details in schema.items():
         if not isinstance(details, dict):
+            prepared[option_name] = details
             errors.append(f"{option_name}: Option definition must be a dictionary")
             continue
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in details:
-                errors.append(f"{option_name}: Missing required field '{field}'")
-        
-        # Validate env variable format
-        if "env" in details:
-            env = details["env"]
-            if not isinstance(env, str):
-                errors.append(f"{option_name}: 'env' must be a string")
-        
-        # Validate arg format
-        if "arg" in details:
-            arg = details["arg"]
-            if not isinstance(arg, str):
-                errors.append(f"{option_name}: 'arg' must be a string")
-            elif not arg.startswith("--"):
-                errors.append(f"{option_name}: 'arg' should start with '--' (got '{arg}')")
-        
-        # Validate depends_on
-        if "depends_on" in details:
-            depends_on = details["depends_on"]
-            if not isinstance(depends_on, list):
-                errors.append(f"{option_name}: 'depends_on' must be a list")
-            else:
-                for dep in depends_on:
-                    if dep not in schema:
-                        errors.append(f"{option_name}: depends on non-existent option '{dep}'")
-                    else:
-                        dep_type = schema[dep].get("type")
-                        if dep_type is not bool:
-                            errors.append(f"{option_name}: can only depend on boolean options ('{dep}' is of type '{dep_type}')")
-
-        # Validate example
-        # It should be the same type as `type`
-        if "example" in details:
-            example = details["example"]
-            expected_type = details.get("type")
-            if expected_type and not isinstance(example, expected_type):
-                errors.append(f"{option_name}: 'example' should be of type '{expected_type.__name__}'")
-
-        # Ensure all details are in OptionDefinition class
-        for key in details.keys():
-            if key not in OptionDefinition.__annotations__:
-                errors.append(f"{option_name}: Unknown field '{key}' in option definition")
-    
-    return errors
\ No newline at end of file
+        defaulted = _apply_defaults(option_name, details)
+        prepared[option_name] = defaulted
+        errors.extend(_iter_option_errors(option_name, defaulted, schema))
+    return prepared, errors
+
+
+def _iter_option_errors(option_name: str, details: dict, schema: dict) -> Iterator[str]:
+    """Yield the validation errors for one defaulted option definition."""
+    # Check required fields (sorted so the messages are in a stable order)
+    for field in sorted(REQUIRED_FIELDS - details.keys()):
+        yield f"{option_name}: Missing required field '{field}'"
+    
+    # One pass over the fields, dispatching to the check for each field that has one
+    for field, value in details.items():
+        validator = _FIELD_VALIDATORS.get(field)
+        if validator is not None:
+            yield from validator(option_name, value, details, schema)
+        elif field not in _KNOWN_FIELDS:
+            yield f"{option_name}: Unknown field '{field}' in option definition"
+
+
+def _check_env(option_name: str, env: Any, details: dict, schema: dict) -> Iterator[str]:
+    """Validate env variable format."""
+    if not isinstance(env, str):
+        yield f"{option_name}: 'env' must be a string"
+
+
+def _check_arg(option_name: str, arg: Any, details: dict, schema: dict) -> Iterator[str]:
+    """Validate arg format."""
+    if not isinstance(arg, str):
+        yield f"{option_name}: 'arg' must be a string"
+    elif not arg.startswith("--"):
+        yield f"{option_name}: 'arg' should start with '--' (got '{arg}')"
+
+
+def _check_depends_on(option_name: str, depends_on: Any, details: dict, schema: dict) -> Iterator[str]:
+    """Validate that depends_on lists existing boolean options."""
+    if not isinstance(depends_on, (list, tuple)):
+        yield f"{option_name}: 'depends_on' must be a list or tuple"
+        return
+    for dep in depends_on:
+        if dep not in schema:
+            yield f"{option_name}: depends on non-existent option '{dep}'"
+        else:
+            dep_type = schema[dep].get("type")
+            if dep_type is not bool:
+                yield f"{option_name}: can only depend on boolean options ('{dep}' is of type '{dep_type}')"
+
+
+def _check_example(option_name: str, example: Any, details: dict, schema: dict) -> Iterator[str]:
+    """Validate example; it should be the same type as `type`."""
+    expected_type = details.get("type")
+    if expected_type and not isinstance(example, expected_type):
+        yield f"{option_name}: 'example' should be of type '{expected_type.__name__}'"
+
+
+# Field name -> check for that field's value. Fields not listed here must still be in OptionDefinition.
+_FIELD_VALIDATORS: dict[str, Callable[[str, Any, dict, dict], Iterator[str]]] = {
+    "env": _check_env,
+    "arg": _check_arg,
+    "depends_on": _check_depends_on,
+    "example": _check_example,
+}
+_KNOWN_FIELDS = frozenset(OptionDefinition.__annotations__)